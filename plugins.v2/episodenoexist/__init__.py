@@ -1,3 +1,5 @@
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Event
 
@@ -5,10 +7,26 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 import datetime
+import heapq
+import operator
 import pytz
+import uuid
 
 from enum import Enum
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    DefaultDict,
+    Dict,
+    List,
+    NotRequired,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+)
 
 from app.db.subscribe_oper import SubscribeOper
 from app.chain.tmdb import TmdbChain
@@ -33,13 +51,14 @@ class HistoryStatus(Enum):
 
 
 class HistoryDataType(Enum):
+    # 成员顺序即配置页面下拉选项顺序
+    LATEST = "最新6条记录"
+    NO_EXIST = "存在缺失"
+    NOT_ALL_NO_EXIST = "已有季缺失"
     ALL_EXIST = "全部存在"
     ADDED_RSS = "已加订阅"
-    NO_EXIST = "存在缺失"
     FAILED = "失败记录"
     ALL = "所有记录"
-    LATEST = "最新6条记录"
-    NOT_ALL_NO_EXIST = "已有季缺失"
 
 
 class NoExistAction(Enum):
@@ -77,6 +96,9 @@ class TvNoExistInfo(TypedDict):
     year: str
     path: str
 
+    # 卡片展示标题
+    display_title: NotRequired[str]
+
     # TMDB ID
     tmdbid: int
 
@@ -93,6 +115,27 @@ class TvNoExistInfo(TypedDict):
 default_poster_path = "/assets/no-image-CweBJ8Ee.jpeg"
 
 
+def get_display_title(title: Optional[str]) -> str:
+    """
+    卡片展示标题, 超过8个字符时截断
+    """
+    title = title or "未知"
+    return title[:8] + "..." if len(title) > 8 else title
+
+
+_tz: Optional[datetime.tzinfo] = None
+
+
+def _get_tz() -> datetime.tzinfo:
+    """
+    获取系统时区, 首次调用后缓存
+    """
+    global _tz
+    if _tz is None:
+        _tz = pytz.timezone(settings.TZ)
+    return _tz
+
+
 def create_tv_no_exist_info(
     title="未知",
     year="未知",
@@ -106,6 +149,7 @@ def create_tv_no_exist_info(
     logger.debug(f"season_episode_no_exist_info: {season_episode_no_exist_info}")
     return TvNoExistInfo(
         title=title,
+        display_title=get_display_title(title),
         year=year,
         path=path,
         tmdbid=tmdbid,
@@ -130,6 +174,286 @@ class ExtendedHistoryDetail(HistoryDetail):
 class History(TypedDict):
     item_unique_flags: List[str]
     details: Dict[str, HistoryDetail]
+    # 每次保存生成新的随机值, 用于判断详情页缓存是否有效
+    version: NotRequired[str]
+
+
+# 检查记录操作名称
+_HISTORY_ACTION_LABELS: Dict[str, str] = {
+    "delete_history": "删除",
+    "add_subscribe_history": "订阅",
+    "set_all_exist_history": "标记存在",
+}
+
+# 检查记录操作按钮模板, 请求参数在生成按钮时填充
+_ACTION_BUTTON_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "add_subscribe_history": {
+        "component": "VBtn",
+        "props": {
+            "class": "text-primary flex-grow",
+            "variant": "tonal",
+            "style": "height: 100%",
+        },
+        "events": {
+            "click": {
+                "api": "plugin/EpisodeNoExist/add_subscribe_history",
+                "method": "get",
+            }
+        },
+        "text": "订阅缺失",
+    },
+    "set_all_exist_history": {
+        "component": "VBtn",
+        "props": {
+            "class": "text-success flex-grow",
+            "style": "height: 100%",
+            "variant": "tonal",
+        },
+        "events": {
+            "click": {
+                "api": "plugin/EpisodeNoExist/set_all_exist_history",
+                "method": "get",
+            }
+        },
+        "text": "标记存在",
+    },
+    "delete_history": {
+        "component": "VBtn",
+        "props": {
+            "class": "text-error flex-grow",
+            "style": "height: 100%",
+            "variant": "tonal",
+        },
+        "events": {
+            "click": {
+                "api": "plugin/EpisodeNoExist/delete_history",
+                "method": "get",
+            }
+        },
+        "text": "删除记录",
+    },
+}
+
+# 各检查状态对应的操作按钮模板, 按显示顺序排列
+_ACTION_BUTTONS_BY_STATUS: Dict[str, List[Dict[str, Any]]] = {
+    HistoryStatus.NO_EXIST.value: [
+        _ACTION_BUTTON_TEMPLATES["delete_history"],
+        _ACTION_BUTTON_TEMPLATES["set_all_exist_history"],
+        _ACTION_BUTTON_TEMPLATES["add_subscribe_history"],
+    ],
+    HistoryStatus.ADDED_RSS.value: [
+        _ACTION_BUTTON_TEMPLATES["delete_history"],
+        _ACTION_BUTTON_TEMPLATES["set_all_exist_history"],
+    ],
+}
+_DEFAULT_ACTION_BUTTONS: List[Dict[str, Any]] = [
+    _ACTION_BUTTON_TEMPLATES["delete_history"],
+]
+
+
+# 统计卡片各层的固定属性, 所有卡片共用
+_STAT_CARD_PROPS: Dict[str, Dict[str, str]] = {
+    "card": {"variant": "tonal", "style": "width: 10rem;"},
+    "card_text": {"class": "d-flex align-center"},
+    "body": {"class": "ml-2"},
+    "title": {"class": "text-caption"},
+    "value_row": {"class": "d-flex align-center flex-wrap"},
+    "value": {"class": "text-h6"},
+}
+
+# 海报加载前的占位图
+_LAZY_SRC_PLACEHOLDER = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAPAAAACgCAQAAACY0inuAAABB0lEQVR42u3RMREAAAjEMF45M65xwcClEppMlx4XwIAFWIAFWIAFWIABC7AAC7AAC7AAAxZgARZgARZgARZgwAIswAIswAIswIAFWIAFWIAFWIABC7AAC7AAC7AACzBgARZgARZgARZgwAIswAIswAIswIABAxZgARZgARZgAQYswAIswAIswAIMWIAFWIAFWIAFWIABC7AAC7AAC7AAAxZgARZgARZgAQYswAIswAIswAIswIAFWIAFWIAFWIABC7AAC7AAC7AAAzYBsAALsAALsAALMGABFmABFmABFmDAAizAAizAAizAAgxYgAVYgAVYgAUYsAALsAALsAALMGABFmAB1m0LDz+locM0WkgAAAAASUVORK5CYII="
+
+# 配置页面下拉选项, 由枚举生成
+_HISTORY_TYPE_ITEMS: List[Dict[str, str]] = [
+    {"title": e.value, "value": e.value} for e in HistoryDataType
+]
+_NO_EXIST_ACTION_ITEMS: List[Dict[str, str]] = [
+    {"title": e.value, "value": e.value} for e in NoExistAction
+]
+
+# 插件配置页面, 内容固定, 导入时生成一次
+_FORM_SPEC: List[Dict[str, Any]] = [
+    {
+        "component": "VForm",
+        "content": [
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "enabled",
+                                    "label": "启用插件",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "only_season_exist",
+                                    "label": "仅检查已有季缺失",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "clear",
+                                    "label": "清理检查记录",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "onlyonce",
+                                    "label": "立即运行一次",
+                                },
+                            }
+                        ],
+                    },
+                ],
+            },
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VTextField",
+                                "props": {
+                                    "model": "cron",
+                                    "label": "执行周期",
+                                    "placeholder": "5位cron表达式, 留空自动",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VSelect",
+                                "props": {
+                                    "model": "history_type",
+                                    "label": "历史数据类型",
+                                    "items": _HISTORY_TYPE_ITEMS,
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
+                            {
+                                "component": "VSelect",
+                                "props": {
+                                    "model": "no_exist_action",
+                                    "label": "缺失处理方式",
+                                    "items": _NO_EXIST_ACTION_ITEMS,
+                                },
+                            }
+                        ],
+                    },
+                ],
+            },
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 12},
+                        "content": [
+                            {
+                                "component": "VTextField",
+                                "props": {
+                                    "model": "whitelist_librarys",
+                                    "label": "电视剧媒体库白名单",
+                                    "placeholder": "*必填, 多个名称用英文逗号分隔",
+                                },
+                            }
+                        ],
+                    },
+                ],
+            },
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 12},
+                        "content": [
+                            {
+                                "component": "VTextField",
+                                "props": {
+                                    "model": "whitelist_media_servers",
+                                    "label": "媒体服务器名称白名单",
+                                    "placeholder": "留空默认全部, 多个名称用英文逗号分隔: emby,embyA,embyB,jellyfin,plex",
+                                },
+                            }
+                        ],
+                    },
+                ],
+            },
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "content": [
+                            {
+                                "component": "VTextarea",
+                                "props": {
+                                    "model": "save_path_replaces",
+                                    "label": "下载路径替换, 一行一个",
+                                    "placeholder": "将媒体库电视剧的路径替换为下载路径, 用英文冒号作为分割。不输入则按默认下载路径处理。\n例如将'/media/library/tv/上载新生 (2020)'的下载路径设置为'/downloads/tv', 则输入 /media/library:/downloads",
+                                },
+                            }
+                        ],
+                    }
+                ],
+            },
+        ],
+    }
+]
+
+# 插件配置默认值
+_FORM_DEFAULTS: Dict[str, Any] = {
+    "enabled": False,
+    "cron": "",
+    "onlyonce": False,
+    "only_season_exist": True,
+    "clear": False,
+    "history_type": HistoryDataType.LATEST.value,
+    "save_path_replaces": "",
+    "no_exist_action": NoExistAction.ONLY_HISTORY.value,
+    "whitelist_media_servers": "",
+    "whitelist_librarys": "",
+}
 
 
 class EpisodeNoExist(_PluginBase):
@@ -167,6 +491,13 @@ class EpisodeNoExist(_PluginBase):
     _plugin_id = "EpisodeNoExist"
     _scheduler = None
 
+    # 定时任务参数, 同一时间只运行一次检查, 合并错过的执行
+    _job_kwargs: Dict[str, Any] = {
+        "max_instances": 1,
+        "coalesce": True,
+        "misfire_grace_time": 600,
+    }
+
     _enabled: bool = False
     _cron: str = ""
     _onlyonce: bool = False
@@ -178,9 +509,60 @@ class EpisodeNoExist(_PluginBase):
     _history_type: str = HistoryDataType.LATEST.value
     _no_exist_action: str = NoExistAction.ONLY_HISTORY.value
     _save_path_replaces: List[str] = []
+    _save_path_replace_pairs: List[Tuple[str, str]] = []
     _whitelist_librarys: List[str] = []
     _whitelist_media_servers: List[str] = []
 
+    # 并发获取TMDB季集信息的线程数
+    _tmdb_max_workers: int = 4
+
+    # 检查记录每累计多少条保存一次
+    _history_save_size: int = 50
+
+    # 检查期间已订阅的 (tmdbid, season), 为 None 时直接查询数据库
+    _subscribed_pairs: Optional[Set[Tuple[int, int]]] = None
+
+    # 检查期间已识别的TMDB媒体信息, 同一剧集出现在多个媒体库时复用
+    _tmdbinfo_cache: Dict[int, Any] = {}
+
+    # 统计图标的 SVG 路径
+    _ICON_PATHS: ClassVar[Dict[Icons, Tuple[str, ...]]] = {
+        Icons.TARGET: (
+            "M512 307.2c-114.688 0-204.8 90.112-204.8 204.8 0 110.592 90.112 204.8 204.8 204.8s204.8-90.112 204.8-204.8-90.112-204.8-204.8-204.8z",
+            "M962.56 471.04H942.08c-20.48-204.8-184.32-372.736-389.12-389.12v-20.48c0-24.576-16.384-40.96-40.96-40.96s-40.96 16.384-40.96 40.96v16.384c-204.8 20.48-372.736 184.32-389.12 393.216h-20.48c-24.576 0-40.96 16.384-40.96 40.96s16.384 40.96 40.96 40.96h16.384c20.48 204.8 184.32 372.736 393.216 393.216v16.384c0 24.576 16.384 40.96 40.96 40.96s40.96-16.384 40.96-40.96V942.08c204.8-20.48 372.736-184.32 393.216-389.12h16.384c24.576 0 40.96-16.384 40.96-40.96s-16.384-40.96-40.96-40.96z m-409.6 389.12v-24.576c0-24.576-16.384-40.96-40.96-40.96s-40.96 16.384-40.96 40.96v24.576c-159.744-20.48-290.816-147.456-307.2-307.2h24.576c24.576 0 40.96-16.384 40.96-40.96s-16.384-40.96-40.96-40.96H163.84c16.384-159.744 147.456-290.816 307.2-307.2v24.576c0 24.576 16.384 40.96 40.96 40.96s40.96-16.384 40.96-40.96V163.84c159.744 20.48 290.816 147.456 307.2 307.2h-24.576c-24.576 0-40.96 16.384-40.96 40.96s16.384 40.96 40.96 40.96h24.576c-16.384 159.744-147.456 290.816-307.2 307.2z",
+        ),
+        Icons.ADD_SCHEDULE: (
+            "M611.157333 583.509333h-63.146666v-63.146666c0-20.138667-16.042667-36.181333-35.84-36.181334-20.138667 0-35.84 16.042667-35.84 35.84v63.146667h-63.146667c-19.797333 0-36.181333 16.384-36.181333 36.181333 0.7168 21.128533 16.759467 35.498667 36.181333 36.181334h63.146667v62.805333c0 20.923733 16.759467 35.84 35.84 35.84 19.797333 0 35.84-16.042667 35.84-35.84v-63.146667h63.146666a35.84 35.84 0 1 0 0-71.68z",
+            "M839.338667 145.749333h-13.653334v86.016c0 56.32-45.738667 102.4-102.4 102.4-56.32 0-102.4-46.08-102.4-102.4V145.749333h-217.770666v86.016c0 56.32-46.08 102.4-102.4 102.4-56.661333 0-102.4-46.08-102.4-102.4V145.749333h-13.653334C120.490667 145.749333 68.266667 197.973333 68.266667 262.144v551.594667c0 64.170667 52.224 116.394667 116.394666 116.394666h654.677334c64.170667 0 116.394667-52.224 116.394666-116.394666V262.144c0-64.170667-52.224-116.394667-116.394666-116.394667z m0 716.117334H184.661333c-26.624 0-48.128-21.504-48.128-48.128V402.773333h750.933334v410.965334c0 26.624-21.504 48.128-48.128 48.128z",
+            "M300.612267 265.796267a34.133333 34.133333 0 0 0 34.133333-34.133334V128a34.133333 34.133333 0 1 0-68.266667 0v103.6288a34.133333 34.133333 0 0 0 34.133334 34.133333zM723.3536 265.796267a34.133333 34.133333 0 0 0 34.133333-34.133334V128a34.133333 34.133333 0 1 0-68.266666 0v103.6288a34.133333 34.133333 0 0 0 34.133333 34.133333z",
+        ),
+        Icons.BUG_REMOVE: (
+            "M945.000296 566.802963c-25.486222-68.608-91.211852-79.530667-144.19437-72.855704a464.402963 464.402963 0 0 0-29.316741-101.148444c20.366222-8.343704 48.279704-12.136296 70.731852 14.487704a37.925926 37.925926 0 0 0 57.912889-49.000297c-51.655111-61.060741-117.94963-53.589333-164.636445-32.426666a333.482667 333.482667 0 0 0-72.021333-78.696297c2.654815-11.377778 4.399407-23.021037 4.399408-35.157333 0-19.683556-4.020148-38.305185-10.695112-55.675259 10.467556-10.960593 30.644148-25.979259 61.705482-23.058963a37.660444 37.660444 0 0 0 41.339259-34.17126 37.925926 37.925926 0 0 0-34.133333-41.339259 145.294222 145.294222 0 0 0-113.246815 36.560593A153.182815 153.182815 0 0 0 513.137778 56.888889c-36.408889 0-69.404444 13.160296-95.876741 34.285037a145.59763 145.59763 0 0 0-109.37837-33.450667 37.925926 37.925926 0 1 0 7.205926 75.548445 73.007407 73.007407 0 0 1 55.902814 17.597629A154.737778 154.737778 0 0 0 358.4 212.005926c0 12.212148 1.782519 23.969185 4.475259 35.384889A334.051556 334.051556 0 0 0 290.512593 326.807704c-46.800593-21.845333-114.194963-30.492444-166.646519 31.478518a37.925926 37.925926 0 0 0 57.912889 49.000297c23.134815-27.382519 52.261926-22.641778 72.969481-13.615408a464.213333 464.213333 0 0 0-28.975407 100.655408c-53.475556-7.395556-120.832 2.768593-146.773333 72.438518a37.925926 37.925926 0 1 0 71.111111 26.43437c10.24-27.534222 44.259556-27.230815 68.532148-23.134814-0.644741 33.374815 1.137778 64.891259 9.253926 106.192592-38.456889 10.884741-81.768296 39.405037-101.793185 103.461926a37.925926 37.925926 0 0 0 72.438518 22.603852c11.150222-35.65037 32.768-48.810667 49.682963-53.551407 47.900444 129.024 148.555852 218.339556 265.102222 218.339555 116.280889 0 216.746667-88.936296 264.798815-217.467259 16.535704 5.271704 36.712296 18.659556 47.369482 52.679111a37.888 37.888 0 1 0 72.400592-22.603852c-19.569778-62.691556-61.44-91.401481-99.252148-102.779259 8.305778-42.059852 10.012444-73.500444 9.367704-107.254519 24.007111-3.678815 55.978667-3.109926 65.877333 23.514074a37.925926 37.925926 0 1 0 71.111111-26.396444z m-321.308444 69.973333c14.791111 14.791111 14.791111 39.063704 0 53.854815a38.039704 38.039704 0 0 1-53.475556 0l-56.888889-56.888889-56.888888 56.888889a38.456889 38.456889 0 0 1-53.854815 0c-14.791111-14.791111-14.791111-39.063704 0-53.854815l56.888889-56.888889-56.888889-56.888888a37.774222 37.774222 0 0 1 0-53.475556c14.791111-14.791111 39.063704-14.791111 53.854815 0l56.888888 56.888889 56.888889-56.888889a37.774222 37.774222 0 0 1 53.475556 0c14.791111 14.791111 14.791111 38.684444 0 53.475556l-56.888889 56.888888 56.888889 56.888889z",
+        ),
+        Icons.WARNING: (
+            "M965.316923 727.276308l-319.015385-578.953846c-58.171077-106.299077-210.944-106.023385-268.996923 0l-318.621538 579.347692c-56.359385 102.636308 18.116923 227.643077 134.695385 227.643077h637.243076c116.184615 0 191.172923-124.416 134.695385-228.036923z m-453.316923 26.781538c-24.812308 0-44.504615-20.086154-44.504615-44.504615 0-24.812308 19.692308-44.898462 44.504615-44.898462a44.701538 44.701538 0 0 1 0 89.403077z m57.501538-361.156923l-20.873846 170.929231c-1.575385 19.298462-17.329231 33.870769-36.627692 33.870769s-35.446154-14.572308-37.021538-33.870769l-20.48-170.929231c-3.150769-33.870769 23.630769-63.015385 57.501538-63.015385 29.932308 0 57.501538 21.582769 57.501538 63.015385z",
+        ),
+        Icons.GLASSES: (
+            "M1028.096 503.808L815.104 204.8c-8.192-12.288-20.48-16.384-32.768-16.384h-126.976c-24.576 0-40.96 20.48-40.96 40.96 0 24.576 20.48 40.96 40.96 40.96h102.4l131.072 184.32H143.36l135.168-188.416h102.4c24.576 0 40.96-16.384 40.96-40.96s-16.384-40.96-40.96-40.96H253.952c-16.384 0-24.576 8.192-32.768 16.384L8.192 499.712c0 8.192-8.192 32.768-8.192 53.248v188.416c0 53.248 45.056 94.208 98.304 94.208h266.24c53.248 0 94.208-40.96 94.208-94.208v-188.416-12.288h122.88V741.376c0 53.248 40.96 94.208 98.304 94.208h266.24c53.248 0 94.208-40.96 94.208-94.208v-188.416c0-16.384-8.192-40.96-12.288-49.152zM376.832 716.8c0 20.48-16.384 40.96-40.96 40.96H122.88c-20.48 0-40.96-20.48-40.96-40.96v-135.168c0-24.576 20.48-40.96 40.96-40.96H335.872c24.576 0 40.96 16.384 40.96 40.96v135.168z m581.632 0c0 20.48-16.384 40.96-40.96 40.96H704.512c-20.48 0-40.96-20.48-40.96-40.96v-135.168c0-24.576 20.48-40.96 40.96-40.96h212.992c24.576 0 40.96 16.384 40.96 40.96v135.168z",
+        ),
+        Icons.STATISTICS: (
+            "M471.04 270.336V20.48c-249.856 20.48-450.56 233.472-450.56 491.52 0 274.432 225.28 491.52 491.52 491.52 118.784 0 229.376-40.96 315.392-114.688L655.36 708.608c-40.96 28.672-94.208 45.056-139.264 45.056-135.168 0-245.76-106.496-245.76-245.76 0-114.688 81.92-217.088 200.704-237.568z",
+            "M552.96 20.48v249.856C655.36 286.72 737.28 368.64 753.664 471.04h249.856C983.04 233.472 790.528 40.96 552.96 20.48zM712.704 651.264l176.128 176.128c65.536-77.824 106.496-172.032 114.688-274.432h-249.856c-8.192 36.864-20.48 69.632-40.96 98.304z",
+        ),
+    }
+
+    # 统计图标, 首次使用时生成
+    _icon_content: Optional[Dict[Icons, Dict[str, Any]]] = None
+
+    # 已生成的检查记录卡片: unique -> (记录版本, 卡片)
+    _post_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+
+    # 已生成的详情页: (记录版本, 历史数据类型) -> 页面, 按最近使用保留
+    _page_cache: "OrderedDict[Tuple[Optional[str], str], List[Dict[str, Any]]]" = (
+        OrderedDict()
+    )
+    _page_cache_size = 8
+
     def init_plugin(self, config: dict[str, Any] | None = None):
         self._subChain = SubscribeChain()
         self._mediaChain = MediaChain()
@@ -189,6 +571,9 @@ class EpisodeNoExist(_PluginBase):
         self._msChain = MediaServerChain()
         self._msHelper = MediaServerHelper()
 
+        self._post_cache = {}
+        self._page_cache = OrderedDict()
+
         if config:
             self._enabled = config.get("enabled", False)
             self._onlyonce = config.get("onlyonce", False)
@@ -212,6 +597,9 @@ class EpisodeNoExist(_PluginBase):
                 self._save_path_replaces = _save_path_replaces.split("\n")
             else:
                 self._save_path_replaces = []
+            self._save_path_replace_pairs = self.__parse_save_path_replaces(
+                self._save_path_replaces
+            )
 
             _whitelist_librarys = config.get("whitelist_librarys", "")
             if _whitelist_librarys and isinstance(_whitelist_librarys, str):
@@ -236,8 +624,9 @@ class EpisodeNoExist(_PluginBase):
                 self._scheduler.add_job(
                     func=self.__refresh,
                     trigger="date",
-                    run_date=datetime.datetime.now(tz=pytz.timezone(settings.TZ))
+                    run_date=datetime.datetime.now(tz=_get_tz())
                     + datetime.timedelta(seconds=3),
+                    **self._job_kwargs,
                 )
 
                 if self._scheduler.get_jobs():
@@ -293,6 +682,12 @@ class EpisodeNoExist(_PluginBase):
                 "methods": ["GET"],
                 "summary": f"订阅 {self.plugin_name} 缺失记录",
             },
+            {
+                "path": "/bulk_action",
+                "endpoint": self.bulk_action,
+                "methods": ["POST"],
+                "summary": f"批量处理 {self.plugin_name} 检查记录",
+            },
         ]
 
     def get_service(self) -> List[Dict[str, Any]]:
@@ -313,7 +708,7 @@ class EpisodeNoExist(_PluginBase):
                     "name": f"{self.plugin_name}",
                     "trigger": CronTrigger.from_crontab(self._cron),
                     "func": self.__refresh,
-                    "kwargs": {},
+                    "kwargs": self._job_kwargs,
                 }
             ]
         elif self._enabled:
@@ -323,13 +718,32 @@ class EpisodeNoExist(_PluginBase):
                     "name": f"{self.plugin_name}",
                     "trigger": CronTrigger.from_crontab("0 8 * * *"),
                     "func": self.__refresh,
-                    "kwargs": {},
+                    "kwargs": self._job_kwargs,
                 }
             ]
         return []
 
     def __refresh(self):
-        self.__get_mediaserver_tv_info()
+        self._tmdbinfo_cache = {}
+        # 一次性加载已有订阅, 避免逐季查询数据库
+        if self._no_exist_action == NoExistAction.ADD_SUBSCRIBE.value:
+            self._subscribed_pairs = {
+                (subscribe.tmdbid, subscribe.season)
+                for subscribe in SubscribeOper().list() or []
+            }
+        try:
+            self.__get_mediaserver_tv_info()
+        finally:
+            self._subscribed_pairs = None
+            self._tmdbinfo_cache = {}
+
+    def __is_subscribed(self, tmdbid: int, season: int) -> bool:
+        """
+        判断用户是否已经添加订阅
+        """
+        if self._subscribed_pairs is not None:
+            return (tmdbid, season) in self._subscribed_pairs
+        return SubscribeOper().exists(tmdbid, season=season)
 
     def __get_mediaservers(self):
         """
@@ -352,6 +766,7 @@ class EpisodeNoExist(_PluginBase):
         if self._clearflag:
             logger.info("清理检查记录")
             self.save_data("history", "")
+            self._page_cache.clear()
             self._clearflag = False
             _history = None
         else:
@@ -361,6 +776,18 @@ class EpisodeNoExist(_PluginBase):
             _history if _history else {"item_unique_flags": [], "details": {}}
         )
 
+        # 尚未保存的检查记录
+        history_deltas: Dict[str, HistoryDetail] = {}
+
+        # 合并并保存检查记录
+        def __save_history():
+            if not history_deltas:
+                return
+            history["details"].update(history_deltas)
+            history["item_unique_flags"].extend(history_deltas.keys())
+            self.__save_history_data(history)
+            history_deltas.clear()
+
         # 添加检查记录
         def __append_history(
             item_unique_flag: str,
@@ -368,21 +795,26 @@ class EpisodeNoExist(_PluginBase):
             tv_no_exist_info: TvNoExistInfo | Dict[str, Any] | None = None,
         ):
 
-            current_time = datetime.datetime.now(tz=pytz.timezone(settings.TZ))
+            current_time = datetime.datetime.now(tz=_get_tz())
 
-            history["item_unique_flags"].append(item_unique_flag)
-
-            history["details"][item_unique_flag] = {
+            processed_flags.add(item_unique_flag)
+            history_deltas[item_unique_flag] = {
                 "exist_status": exist_status.value,
                 "tv_no_exist_info": (tv_no_exist_info if tv_no_exist_info else None),
                 "last_update": current_time.strftime("%m-%d %H:%M"),
                 "last_update_full": current_time.strftime("%Y-%m-%d %H:%M:%S"),
             }
-            logger.info(
-                f"添加检查记录: {item_unique_flag}: {history['details'][item_unique_flag]}"
-            )
+            logger.info("添加检查记录: %s: %s", item_unique_flag, exist_status.value)
+            logger.debug("检查记录详情: %s", history_deltas[item_unique_flag])
 
-            self.save_data("history", history)
+            if len(history_deltas) >= self._history_save_size:
+                __save_history()
+
+        # 循环中用到的枚举值和配置, 只取一次
+        tv_type = MediaType.TV.value
+        movie_type = MediaType.MOVIE.value
+        is_add_subscribe = self._no_exist_action == NoExistAction.ADD_SUBSCRIBE.value
+        is_set_all_exist = self._no_exist_action == NoExistAction.SET_ALL_EXIST.value
 
         mediaservers = self.__get_mediaservers()
         if not mediaservers:
@@ -395,199 +827,200 @@ class EpisodeNoExist(_PluginBase):
         logger.info(f"媒体库白名单: {self._whitelist_librarys}")
 
         item_unique_flags = history.get("item_unique_flags", [])
-        logger.debug(f"item_unique_flags: {item_unique_flags}")
+        logger.debug("item_unique_flags: %s", item_unique_flags)
+        # 已处理过的媒体, 用于快速跳过
+        processed_flags = set(item_unique_flags)
 
-        # 遍历媒体服务器
-        for mediaserver in mediaservers:
-            logger.debug(f"mediaserver: {mediaserver}")
-            if not mediaserver:
-                continue
-            if (
-                self._whitelist_media_servers
-                and mediaserver not in self._whitelist_media_servers
-            ):
-                logger.info(f"【{mediaserver}】不在媒体服务器名称白名单内, 跳过")
-                continue
-            logger.info(f"开始获取媒体库 {mediaserver} 的数据 ...")
-
-            __item_count = 0
-            librarys = self._msChain.librarys(mediaserver)
-            for library in librarys:
-                logger.debug(f"媒体库名：{library.name}")
-                if library.name not in self._whitelist_librarys:
+        # 异常或停止退出时也保存已处理的记录
+        try:
+            # 遍历媒体服务器
+            for mediaserver in mediaservers:
+                logger.debug(f"mediaserver: {mediaserver}")
+                if not mediaserver:
                     continue
-                logger.info(f"正在获取 {mediaserver} 媒体库 {library.name} ...")
-                logger.debug(f"library.id: {library.id}")
-
-                if not library.id:
-                    logger.debug("未获取到Library ID, 跳过获取缺失集数")
+                if (
+                    self._whitelist_media_servers
+                    and mediaserver not in self._whitelist_media_servers
+                ):
+                    logger.info(f"【{mediaserver}】不在媒体服务器名称白名单内, 跳过")
                     continue
+                logger.info(f"开始获取媒体库 {mediaserver} 的数据 ...")
 
-                library_items = self._msChain.items(mediaserver, library.id)
-                if not library_items:
-                    logger.debug("未获取到媒体库items信息, 跳过获取缺失集数")
-                    continue
-
-                for item in library_items:
-                    # if __item_count >= 30:
-                    #     break
-                    __item_count += 1
-
-                    if not item:
-                        logger.debug("未获取到Item媒体信息, 跳过获取缺失集数")
-                        continue
-
-                    if not item.item_id:
-                        logger.debug("未获取到Item ID, 跳过获取缺失集数")
+                __item_count = 0
+                librarys = self._msChain.librarys(mediaserver)
+                for library in librarys:
+                    logger.debug(f"媒体库名：{library.name}")
+                    if library.name not in self._whitelist_librarys:
                         continue
+                    logger.info(f"正在获取 {mediaserver} 媒体库 {library.name} ...")
+                    logger.debug(f"library.id: {library.id}")
 
-                    item_title = (
-                        item.title or item.original_title or f"ItemID: {item.item_id}"
-                    )
-
-                    item_unique_flag = (
-                        f"{mediaserver}_{item.library}_{item.item_id}_{item_title}"
-                    )
-
-                    if item_unique_flag in item_unique_flags:
-                        logger.info(f"【{item_title}】已处理过, 跳过")
+                    if not library.id:
+                        logger.debug("未获取到Library ID, 跳过获取缺失集数")
                         continue
 
-                    logger.info(f"正在获取 {item_title} ...")
+                    # 逐条处理媒体库返回的数据, 不预先生成完整列表
+                    for item in self._msChain.items(mediaserver, library.id) or ():
+                        # if __item_count >= 30:
+                        #     break
+                        # 插件停止时退出, 避免停止服务时长时间等待
+                        if self._event.is_set():
+                            logger.info("插件服务停止, 中止获取媒体库电视剧数据")
+                            return
+                        __item_count += 1
+
+                        if not item:
+                            logger.debug("未获取到Item媒体信息, 跳过获取缺失集数")
+                            continue
 
-                    seasoninfo = {}
+                        if not item.item_id:
+                            logger.debug("未获取到Item ID, 跳过获取缺失集数")
+                            continue
 
-                    # 类型
-                    item_type = (
-                        MediaType.TV.value
-                        if item.item_type in ["Series", "show"]
-                        else MediaType.MOVIE.value
-                    )
-                    if item_type == MediaType.MOVIE.value:
-                        logger.warn(f"【{item_title}】为{MediaType.MOVIE.value}, 跳过")
-                        continue
-                    if item_type == MediaType.TV.value and item.tmdbid:
-                        # 查询剧集信息
-                        espisodes_info = (
-                            self._msChain.episodes(mediaserver, item.item_id) or []
+                        item_title = (
+                            item.title
+                            or item.original_title
+                            or f"ItemID: {item.item_id}"
                         )
-                        logger.debug(
-                            f"获取到媒体库【{item_title}】季集信息:{espisodes_info}"
+
+                        item_unique_flag = (
+                            f"{mediaserver}_{item.library}_{item.item_id}_{item_title}"
                         )
-                        for episode_info in espisodes_info:
-                            seasoninfo[episode_info.season] = episode_info.episodes
 
-                    # 插入数据
-                    item_dict = item.dict()
-                    item_dict["seasoninfo"] = seasoninfo
-                    item_dict["item_type"] = item_type
+                        if item_unique_flag in processed_flags:
+                            logger.info(f"【{item_title}】已处理过, 跳过")
+                            continue
 
-                    logger.info(f"获到媒体库【{item_title}】数据：{item_dict}")
+                        logger.info(f"正在获取 {item_title} ...")
 
-                    is_add_subscribe_success, tv_no_exist_info = (
-                        self.__get_item_no_exist_info(item_dict)
-                    )
+                        seasoninfo = {}
 
-                    if is_add_subscribe_success and tv_no_exist_info:
-                        if not tv_no_exist_info["season_episode_no_exist_info"]:
-                            logger.info(f"【{item_title}】所有季集均已存在/订阅")
-                            __append_history(
-                                item_unique_flag=item_unique_flag,
-                                exist_status=HistoryStatus.ALL_EXIST,
-                                tv_no_exist_info=tv_no_exist_info,
+                        # 类型
+                        item_type = (
+                            tv_type
+                            if item.item_type in ["Series", "show"]
+                            else movie_type
+                        )
+                        if item_type == movie_type:
+                            logger.warn(f"【{item_title}】为{movie_type}, 跳过")
+                            continue
+                        if item_type == tv_type and item.tmdbid:
+                            # 查询剧集信息
+                            espisodes_info = (
+                                self._msChain.episodes(mediaserver, item.item_id) or []
                             )
-                        else:
-                            logger.info(
-                                f"【{item_title}】缺失集数信息：{tv_no_exist_info}"
+                            logger.debug(
+                                "获取到媒体库【%s】季集信息:%s",
+                                item_title,
+                                espisodes_info,
                             )
+                            for episode_info in espisodes_info:
+                                seasoninfo[episode_info.season] = episode_info.episodes
 
-                            if (
-                                self._no_exist_action
-                                == NoExistAction.ADD_SUBSCRIBE.value
-                            ):
-                                logger.info("开始订阅缺失集数")
-                                is_add_subscribe_success = (
-                                    self.__add_subscribe_by_tv_no_exist_info(
-                                        tv_no_exist_info, item_unique_flag
-                                    )
+                        logger.info(f"获到媒体库【{item_title}】数据")
+                        logger.debug("媒体库【%s】数据：%r", item_title, item)
+
+                        is_add_subscribe_success, tv_no_exist_info = (
+                            self.__get_item_no_exist_info(item, seasoninfo, item_type)
+                        )
+
+                        if is_add_subscribe_success and tv_no_exist_info:
+                            if not tv_no_exist_info["season_episode_no_exist_info"]:
+                                logger.info(f"【{item_title}】所有季集均已存在/订阅")
+                                __append_history(
+                                    item_unique_flag=item_unique_flag,
+                                    exist_status=HistoryStatus.ALL_EXIST,
+                                    tv_no_exist_info=tv_no_exist_info,
+                                )
+                            else:
+                                logger.info(
+                                    "【%s】缺失集数信息：%s",
+                                    item_title,
+                                    tv_no_exist_info,
                                 )
-                                if is_add_subscribe_success:
+
+                                if is_add_subscribe:
+                                    logger.info("开始订阅缺失集数")
+                                    is_add_subscribe_success = (
+                                        self.__add_subscribe_by_tv_no_exist_info(
+                                            tv_no_exist_info, item_unique_flag
+                                        )
+                                    )
+                                    if is_add_subscribe_success:
+                                        __append_history(
+                                            item_unique_flag=item_unique_flag,
+                                            exist_status=HistoryStatus.ADDED_RSS,
+                                            tv_no_exist_info=tv_no_exist_info,
+                                        )
+                                    else:
+                                        logger.warn(
+                                            f"订阅【{item_title}】失败, 仅记录缺失集数"
+                                        )
+                                        __append_history(
+                                            item_unique_flag=item_unique_flag,
+                                            exist_status=HistoryStatus.NO_EXIST,
+                                            tv_no_exist_info=tv_no_exist_info,
+                                        )
+                                elif is_set_all_exist:
+                                    logger.debug("将缺失季集标记为存在")
                                     __append_history(
                                         item_unique_flag=item_unique_flag,
-                                        exist_status=HistoryStatus.ADDED_RSS,
+                                        exist_status=HistoryStatus.ALL_EXIST,
                                         tv_no_exist_info=tv_no_exist_info,
                                     )
+
                                 else:
-                                    logger.warn(
-                                        f"订阅【{item_title}】失败, 仅记录缺失集数"
-                                    )
+                                    logger.debug("仅记录缺失集数")
                                     __append_history(
                                         item_unique_flag=item_unique_flag,
                                         exist_status=HistoryStatus.NO_EXIST,
                                         tv_no_exist_info=tv_no_exist_info,
                                     )
-                            elif (
-                                self._no_exist_action
-                                == NoExistAction.SET_ALL_EXIST.value
-                            ):
-                                logger.debug("将缺失季集标记为存在")
-                                __append_history(
-                                    item_unique_flag=item_unique_flag,
-                                    exist_status=HistoryStatus.ALL_EXIST,
-                                    tv_no_exist_info=tv_no_exist_info,
-                                )
-
-                            else:
-                                logger.debug("仅记录缺失集数")
-                                __append_history(
-                                    item_unique_flag=item_unique_flag,
-                                    exist_status=HistoryStatus.NO_EXIST,
-                                    tv_no_exist_info=tv_no_exist_info,
-                                )
-                    else:
-                        logger.warn(f"【{item_title}】获取缺失集数信息失败")
-                        __append_history(
-                            item_unique_flag=item_unique_flag,
-                            exist_status=HistoryStatus.FAILED,
-                            tv_no_exist_info=tv_no_exist_info,
-                        )
-
-                logger.info(f"{mediaserver} 媒体库 {library.name} 获取数据完成")
+                        else:
+                            logger.warn(f"【{item_title}】获取缺失集数信息失败")
+                            __append_history(
+                                item_unique_flag=item_unique_flag,
+                                exist_status=HistoryStatus.FAILED,
+                                tv_no_exist_info=tv_no_exist_info,
+                            )
 
+                    __save_history()
+                    logger.info(f"{mediaserver} 媒体库 {library.name} 获取数据完成")
+        finally:
+            __save_history()
         logger.info(
             f"媒体库缺失集数据获取完成, 已处理媒体数量: {len(item_unique_flags)}"
         )
 
     def __get_item_no_exist_info(
-        self, item_dict: dict[str, Any]
+        self,
+        item: schemas.MediaServerItem,
+        seasoninfo: Dict[int, List[int]],
+        item_type: str,
     ) -> tuple[bool, TvNoExistInfo]:
         """
         获取缺失集数
         """
 
-        title = item_dict.get("title") or item_dict.get("original_title")
+        title = item.title or item.original_title
 
         tv_no_exist_info = create_tv_no_exist_info(
             title=title,
-            year=item_dict.get("year"),
-            path=item_dict.get(
-                "path",
-            ),
+            year=item.year,
+            path=item.path,
         )
 
-        logger.debug(f" tv_no_exist_info create_tv_no_exist_info: {tv_no_exist_info}")
+        logger.debug(" tv_no_exist_info create_tv_no_exist_info: %s", tv_no_exist_info)
 
-        tmdbid: int | None = item_dict.get("tmdbid")
+        tmdbid: int | None = item.tmdbid
         if not tmdbid:
-            logger.debug(
-                f"【{item_dict.get('title')}】未获取到TMDBID, 跳过获取缺失集数"
-            )
+            logger.debug(f"【{item.title}】未获取到TMDBID, 跳过获取缺失集数")
             return False, tv_no_exist_info
 
         tv_no_exist_info["tmdbid"] = tmdbid
         # tv_no_exist_info.tmdbid = tmdbid
 
-        mtype = item_dict.get("item_type")
+        mtype = item_type
         if not mtype:
             logger.debug(f"【{title}】未获取到媒体类型, 跳过获取缺失集数")
             return False, tv_no_exist_info
@@ -601,31 +1034,40 @@ class EpisodeNoExist(_PluginBase):
             episode_no_exist: List[int],
             episode_total: int,
         ):
-            logger.debug(f"添加【{title}】第【{season}】季缺失集：{episode_no_exist}")
+            logger.debug(
+                "添加【%s】第【%s】季缺失集：%s", title, season, episode_no_exist
+            )
             __season_info: EpisodeNoExistInfo = {
                 "season": season,
                 "episode_no_exist": episode_no_exist,
                 "episode_total": episode_total,
             }
 
-            logger.debug(f"【{title}】第【{season}】季缺失集信息：{__season_info}")
+            logger.debug("【%s】第【%s】季缺失集信息：%s", title, season, __season_info)
 
             tv_no_exist_info["season_episode_no_exist_info"][
                 str(season)
             ] = __season_info
 
-            logger.debug(f"【{title}】缺失季集数的电视剧信息：{tv_no_exist_info}")
+            logger.debug("【%s】缺失季集数的电视剧信息：%s", title, tv_no_exist_info)
 
-        exist_season_info = item_dict.get("seasoninfo") or {}
+        exist_season_info = seasoninfo or {}
 
-        logger.debug(f"【{title}】在媒体库已有季集信息：{exist_season_info}")
+        # 仅在缺失处理方式为添加订阅时跳过已订阅的季
+        check_subscribed = self._no_exist_action == NoExistAction.ADD_SUBSCRIBE.value
+
+        logger.debug("【%s】在媒体库已有季集信息：%s", title, exist_season_info)
         logger.debug(f"【{title}】开始获取媒体信息 mtype：{mtype}, tmdbid：{tmdbid}")
 
         # 获取媒体信息
-        tmdbinfo = self._mediaChain.recognize_media(
-            mtype=MediaType.TV,
-            tmdbid=tmdbid,
-        )
+        if tmdbid in self._tmdbinfo_cache:
+            tmdbinfo = self._tmdbinfo_cache[tmdbid]
+        else:
+            tmdbinfo = self._mediaChain.recognize_media(
+                mtype=MediaType.TV,
+                tmdbid=tmdbid,
+            )
+            self._tmdbinfo_cache[tmdbid] = tmdbinfo
 
         if tmdbinfo:
             tv_no_exist_info["poster_path"] = (
@@ -649,8 +1091,10 @@ class EpisodeNoExist(_PluginBase):
             if not exist_season_info and not self._only_season_exist:
                 logger.debug(f"【{title}】全部季不存在, 添加全部季集数")
                 # 全部季不存在
-                for season, _ in tmdbinfo_seasons:
-                    filted_episodes = self.__filter_episodes(tmdbid, season)
+                seasons_episodes = self.__filter_seasons_episodes(
+                    tmdbid, [season for season, _ in tmdbinfo_seasons]
+                )
+                for season, filted_episodes in seasons_episodes.items():
                     if not filted_episodes:
                         logger.debug(
                             f"【{title}】第【{season}】季未获取到TMDB集数信息, 跳过"
@@ -660,7 +1104,7 @@ class EpisodeNoExist(_PluginBase):
                     episode_total = len(filted_episodes)
 
                     # 判断用户是否已经添加订阅
-                    if SubscribeOper().exists(tmdbid, season=season):
+                    if check_subscribed and self.__is_subscribed(tmdbid, season):
                         logger.info(f"【{title}】第【{season}】季已存在订阅, 跳过")
                         continue
                     __append_season_info(
@@ -670,11 +1114,37 @@ class EpisodeNoExist(_PluginBase):
                     )
             else:
                 logger.debug(f"【{title}】检查每季缺失的集")
+                # 媒体库已包含TMDB该季全部集, 无需再获取集数信息
+                check_seasons = []
+                for season, season_episodes in tmdbinfo_seasons:
+                    exist_episode = exist_season_info.get(season)
+                    if (
+                        exist_episode
+                        and season_episodes
+                        and set(season_episodes).issubset(exist_episode)
+                    ):
+                        logger.debug(f"【{title}】第【{season}】季全部集存在")
+                        continue
+                    check_seasons.append(season)
+
+                seasons_episodes = self.__filter_seasons_episodes(tmdbid, check_seasons)
+
                 # 检查每季缺失的季集
-                for season, _ in tmdbinfo_seasons:
-                    filted_episodes = self.__filter_episodes(tmdbid, season)
+                for season, filted_episodes in seasons_episodes.items():
+                    # 该季已存在的集, 选项仅检查已有季缺失未开启时添加全部季
+                    exist_episode = exist_season_info.get(season)
                     logger.debug(
-                        f"【{title}】第【{season}】季在TMDB的集数信息: {filted_episodes}"
+                        "【%s】第【%s】季在媒体库已存在的集数信息: %s",
+                        title,
+                        season,
+                        exist_episode,
+                    )
+
+                    logger.debug(
+                        "【%s】第【%s】季在TMDB的集数信息: %s",
+                        title,
+                        season,
+                        filted_episodes,
                     )
                     if not filted_episodes:
                         logger.debug(
@@ -684,11 +1154,6 @@ class EpisodeNoExist(_PluginBase):
                     # 该季总集数
                     episode_total = len(filted_episodes)
 
-                    # 该季已存在的集, 选项仅检查已有季缺失未开启时添加全部季
-                    exist_episode = exist_season_info.get(season)
-                    logger.debug(
-                        f"【{title}】第【{season}】季在媒体库已存在的集数信息: {exist_episode}"
-                    )
                     if exist_episode:
                         logger.debug(f"查找【{title}】第【{season}】季缺失集集数")
                         # 按TMDB集数查找缺失集
@@ -702,7 +1167,7 @@ class EpisodeNoExist(_PluginBase):
                             continue
 
                         # 判断用户是否已经添加订阅
-                        if SubscribeOper().exists(tmdbid, season=season):
+                        if check_subscribed and self.__is_subscribed(tmdbid, season):
                             logger.info(f"【{title}】第【{season}】季已存在订阅, 跳过")
                             continue
                         # 添加不存在的季集信息
@@ -714,7 +1179,7 @@ class EpisodeNoExist(_PluginBase):
                     else:
                         logger.debug(f"【{title}】第【{season}】季全集不存在")
                         # 判断用户是否已经添加订阅
-                        if SubscribeOper().exists(tmdbid, season=season):
+                        if check_subscribed and self.__is_subscribed(tmdbid, season):
                             logger.info(f"【{title}】第【{season}】季已存在订阅, 跳过")
                             continue
                         # 该季全集不存在, 选项仅检查已有季缺失未开启时添加全部集
@@ -725,7 +1190,7 @@ class EpisodeNoExist(_PluginBase):
                                 episode_total=episode_total,
                             )
 
-            logger.debug(f"【{title}】季集信息: {tv_no_exist_info}")
+            logger.debug("【%s】季集信息: %s", title, tv_no_exist_info)
 
             # 存在不完整的剧集
             if tv_no_exist_info["season_episode_no_exist_info"]:
@@ -740,13 +1205,34 @@ class EpisodeNoExist(_PluginBase):
             logger.debug(f"【{title}】未获取到TMDB信息, 跳过获取缺失集数")
             return False, tv_no_exist_info
 
+    def __filter_seasons_episodes(
+        self, tmdbid: int, seasons: List[int]
+    ) -> Dict[int, List[int]]:
+        """
+        并发获取多季在TMDB已播出的集, 按传入顺序返回
+        """
+        if len(seasons) <= 1:
+            return {
+                season: self.__filter_episodes(tmdbid, season) for season in seasons
+            }
+
+        with ThreadPoolExecutor(max_workers=self._tmdb_max_workers) as executor:
+            return dict(
+                zip(
+                    seasons,
+                    executor.map(
+                        lambda season: self.__filter_episodes(tmdbid, season), seasons
+                    ),
+                )
+            )
+
     def __filter_episodes(self, tmdbid, season):
         # 电视剧某季所有集
         episodes_info = self._tmdbChain.tmdb_episodes(tmdbid=tmdbid, season=season)
 
         episodes = []
         # 遍历集，筛选当前日期发布的剧集
-        current_time = datetime.datetime.now(tz=pytz.timezone(settings.TZ))
+        current_time = datetime.datetime.now(tz=_get_tz())
         for episode in episodes_info:
             if episode and episode.air_date:
                 # 将 air_date 字符串转换为 datetime 对象
@@ -789,6 +1275,7 @@ class EpisodeNoExist(_PluginBase):
         """
         停止服务
         """
+        self._page_cache.clear()
         try:
             if self._scheduler:
                 self._scheduler.remove_all_jobs()
@@ -802,17 +1289,30 @@ class EpisodeNoExist(_PluginBase):
 
     @staticmethod
     def __remove_history_by_unique(historys, unique: str):
-
-        historys["item_unique_flags"] = [
-            item for item in historys["item_unique_flags"] if item != unique
-        ]
-
-        if unique in historys["details"]:
-            del historys["details"][unique]
-            return True, historys
-        else:
+        """
+        删除检查记录详情, item_unique_flags 由调用方统一过滤
+        """
+        if historys["details"].pop(unique, None) is None:
             logger.warn(f"unique: {unique} 不在历史记录里")
             return False, historys
+        return True, historys
+
+    @staticmethod
+    def __parse_save_path_replaces(
+        save_path_replaces: List[str],
+    ) -> List[Tuple[str, str]]:
+        """
+        解析下载路径替换规则, 返回 (媒体库路径, 下载路径) 列表
+        """
+        replace_pairs = []
+        for _save_path_replace in save_path_replaces:
+            replace_list = [
+                part.strip() for part in _save_path_replace.split(":") if part.strip()
+            ]
+            if len(replace_list) < 2:
+                continue
+            replace_pairs.append((replace_list[0], replace_list[1]))
+        return replace_pairs
 
     def __checke_and_add_subscribe(
         self,
@@ -827,16 +1327,8 @@ class EpisodeNoExist(_PluginBase):
         logger.info(f"开始检查 {title_season} 是否已添加订阅")
 
         save_path_replaced = None
-        if self._save_path_replaces and save_path:
-            for _save_path_replace in self._save_path_replaces:
-                replace_list = [
-                    part.strip()
-                    for part in _save_path_replace.split(":")
-                    if part.strip()
-                ]
-                if len(replace_list) < 2:
-                    continue
-                _lib_path_str, _save_path_str = replace_list[:2]
+        if self._save_path_replace_pairs and save_path:
+            for _lib_path_str, _save_path_str in self._save_path_replace_pairs:
                 logger.debug(f"替换路径: {_lib_path_str} -> {_save_path_str}")
                 if _lib_path_str in save_path:
                     save_path_parent_str = str(Path(save_path).parent)
@@ -848,19 +1340,19 @@ class EpisodeNoExist(_PluginBase):
                     )
                     break
 
-        # 判断用户是否已经添加订阅
-        if SubscribeOper().exists(tmdbid, season=season):
-            logger.info(f"{title_season} 订阅已存在")
-            return True
-
-        logger.info(f"开始添加订阅: {title_season}")
-
         if not isinstance(season, int):
             try:
                 season = int(season)
             except ValueError:
                 logger.warn("season 无法转换为整数")
 
+        # 判断用户是否已经添加订阅
+        if self.__is_subscribed(tmdbid, season):
+            logger.info(f"{title_season} 订阅已存在")
+            return True
+
+        logger.info(f"开始添加订阅: {title_season}")
+
         # 添加订阅
         is_add_success, msg = self._subChain.add(
             title=title,
@@ -878,17 +1370,19 @@ class EpisodeNoExist(_PluginBase):
             logger.warn(f"添加订阅 {title_season} 失败: {msg}")
             return False
         logger.info(f"已添加订阅: {title_season}")
+        if self._subscribed_pairs is not None:
+            self._subscribed_pairs.add((tmdbid, season))
         return True
 
     @staticmethod
     def __update_exist_status_by_unique(historys, unique: str, new_status: str):
-        if unique in historys["details"]:
-            historys["details"][unique]["exist_status"] = new_status
-            logger.info(f"更新检查记录 {unique} 状态为: {new_status}")
-            return True, historys
-        else:
+        detail = historys["details"].get(unique)
+        if detail is None:
             logger.warn(f"unique: {unique} 不在历史记录里")
             return False, historys
+        detail["exist_status"] = new_status
+        logger.info(f"更新检查记录 {unique} 状态为: {new_status}")
+        return True, historys
 
     def __add_subscribe_by_tv_no_exist_info(
         self, tv_no_exist_info: TvNoExistInfo, unique: str
@@ -904,47 +1398,45 @@ class EpisodeNoExist(_PluginBase):
             logger.warn(f"unique: {unique} 季集信息不完整, 跳过订阅")
             return False
 
-        season_keys = season_episode_no_exist_info.keys()
+        for season_key, season_info in season_episode_no_exist_info.items():
+            # 记录中的季号为字符串, 统一转换为整数
+            try:
+                season = int(season_key)
+            except ValueError:
+                logger.warn("season 无法转换为整数")
+                return False
 
-        for season in season_keys:
             total_episode = None
-            # 尝试直接获取值
-            season_info = season_episode_no_exist_info.get(season)
-
             if season_info:
                 total_episode = season_info.get("episode_total")
                 episode_no_exist = season_info.get("episode_no_exist")
                 if not episode_no_exist:
                     logger.info(
-                        f"【{title}】第 {season} 季所有集均缺失,  仅添加已有季选项为: {self._only_season_exist}"
+                        "【%s】第 %s 季所有集均缺失,  仅添加已有季选项为: %s",
+                        title,
+                        season,
+                        self._only_season_exist,
                     )
                     # if self._history_type == HistoryDataType.NOT_ALL_NO_EXIST:
                     if self._only_season_exist:
-                        logger.info(f"跳过订阅:【{title}】第 {season} 季")
+                        logger.info("跳过订阅:【%s】第 %s 季", title, season)
                         continue
                     else:
-                        logger.info(f"添加订阅:【{title}】第 {season} 季")
+                        logger.info("添加订阅:【%s】第 %s 季", title, season)
 
                 else:
                     logger.info(
-                        f"【{title}】第 {season} 季缺失集数: {episode_no_exist}, 将添加订阅"
+                        "【%s】第 %s 季缺失集数: %s, 将添加订阅",
+                        title,
+                        season,
+                        episode_no_exist,
                     )
 
-            __season_int: int | None = None
-            if not isinstance(season, int):
-                try:
-                    __season_int = int(season)
-                except ValueError:
-                    logger.warn("season 无法转换为整数")
-                    return False
-            else:
-                __season_int = season
-
             is_add_subscribe_success = self.__checke_and_add_subscribe(
                 title=title,
                 year=year,
                 tmdbid=tmdbid,
-                season=__season_int,
+                season=season,
                 save_path=save_path,
                 total_episode=total_episode,
             )
@@ -955,425 +1447,218 @@ class EpisodeNoExist(_PluginBase):
 
     def __add_subscribe_by_unique(self, historys, unique: str):
 
-        if unique in historys["details"]:
-            tv_no_exist_info = historys["details"][unique]["tv_no_exist_info"]
-            is_add_subscribe_success = self.__add_subscribe_by_tv_no_exist_info(
-                tv_no_exist_info, unique
-            )
-            if is_add_subscribe_success:
-                is_update_exist_status_success, historys = (
-                    self.__update_exist_status_by_unique(
-                        historys=historys,
-                        unique=unique,
-                        new_status=HistoryStatus.ADDED_RSS.value,
-                    )
-                )
-                return is_update_exist_status_success, historys
-            else:
-                return False, historys
-
-        else:
+        detail = historys["details"].get(unique)
+        if detail is None:
             logger.warn(f"unique: {unique} 不在历史记录里")
             return False, historys
 
-    def delete_history(self, key: str, apikey: str):
+        is_add_subscribe_success = self.__add_subscribe_by_tv_no_exist_info(
+            detail["tv_no_exist_info"], unique
+        )
+        if not is_add_subscribe_success:
+            return False, historys
+
+        detail["exist_status"] = HistoryStatus.ADDED_RSS.value
+        logger.info(f"更新检查记录 {unique} 状态为: {HistoryStatus.ADDED_RSS.value}")
+        return True, historys
+
+    def __apply_history_action(self, historys, unique: str, action: str):
         """
-        删除同步检查记录
+        对单条检查记录执行操作, 不保存
+        """
+        if action == "delete_history":
+            return EpisodeNoExist.__remove_history_by_unique(historys, unique)
+        if action == "add_subscribe_history":
+            return self.__add_subscribe_by_unique(historys, unique)
+        if action == "set_all_exist_history":
+            return EpisodeNoExist.__update_exist_status_by_unique(
+                historys, unique, HistoryStatus.ALL_EXIST.value
+            )
+        return False, historys
+
+    def __load_history_or_fail(
+        self, apikey: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[schemas.Response]]:
+        """
+        校验API密钥并读取检查记录, 失败时返回错误响应
         """
-        logger.info(f"开始删除检查记录: {key}")
         if apikey != settings.API_TOKEN:
             logger.warn("API密钥错误")
-            return schemas.Response(success=False, message="API密钥错误")
-        # 检查记录
+            return None, schemas.Response(success=False, message="API密钥错误")
         historys = self.get_data("history")
         if not historys:
             logger.warn("未找到检查记录")
-            return schemas.Response(success=False, message="未找到检查记录")
+            return None, schemas.Response(success=False, message="未找到检查记录")
+        return historys, None
 
-        is_success, historys = EpisodeNoExist.__remove_history_by_unique(historys, key)
+    def __save_history_data(self, historys: Dict[str, Any]):
+        """
+        保存检查记录, 同时生成新的版本号
+        """
+        historys["version"] = uuid.uuid4().hex
+        self.save_data("history", historys)
 
-        if is_success:
-            logger.info(f"删除检查记录 {key} 成功")
-            self.save_data("history", historys)
-            return schemas.Response(success=True, message="删除成功")
-        else:
-            logger.warn(f"删除检查记录 {key} 失败")
-            return schemas.Response(success=False, message="删除失败")
+    def __with_history(
+        self,
+        apikey: str,
+        fn: Callable[[Dict[str, Any], Dict[str, Any]], Tuple[bool, schemas.Response]],
+    ) -> schemas.Response:
+        """
+        校验API密钥并读取检查记录后执行 fn(historys, details), fn 返回有修改时才保存
+        """
+        historys, err_response = self.__load_history_or_fail(apikey)
+        if err_response:
+            return err_response
+        modified, response = fn(historys, historys["details"])
+        if modified:
+            self.__save_history_data(historys)
+        return response
+
+    def bulk_action(self, keys: List[str], action: str, apikey: str):
+        """
+        批量处理检查记录, 只读取和保存一次
+        """
+        label = _HISTORY_ACTION_LABELS.get(action)
+        logger.info(f"开始{label or action}检查记录: {keys}")
+        if not label:
+            logger.warn(f"不支持的操作: {action}")
+            return schemas.Response(success=False, message="不支持的操作")
+
+        def __apply(historys, details):
+            success_keys = set()
+            for key in keys:
+                if key not in details:
+                    logger.warn(f"unique: {key} 不在历史记录里")
+                    logger.warn(f"{label} {key} 失败")
+                    continue
+                is_success, historys = self.__apply_history_action(
+                    historys, key, action
+                )
+                if is_success:
+                    logger.info(f"{label} {key} 成功")
+                    self._post_cache.pop(key, None)
+                    success_keys.add(key)
+                else:
+                    logger.warn(f"{label} {key} 失败")
+
+            # 删除的记录只需过滤一次 item_unique_flags
+            if action == "delete_history" and success_keys:
+                historys["item_unique_flags"] = [
+                    flag
+                    for flag in historys["item_unique_flags"]
+                    if flag not in success_keys
+                ]
+
+            success_count = len(success_keys)
+            if not success_count:
+                return False, schemas.Response(success=False, message=f"{label}失败")
+            if success_count < len(keys):
+                return True, schemas.Response(
+                    success=True,
+                    message=f"{label}成功 {success_count} 条, 失败 {len(keys) - success_count} 条",
+                )
+            return True, schemas.Response(success=True, message=f"{label}成功")
+
+        return self.__with_history(apikey, __apply)
+
+    def delete_history(self, key: str, apikey: str):
+        """
+        删除同步检查记录
+        """
+        return self.bulk_action([key], "delete_history", apikey)
 
     def add_subscribe_history(self, key: str, apikey: str):
         """
         订阅缺失检查记录
         """
-        logger.info(f"开始订阅检查记录: {key}")
-        if apikey != settings.API_TOKEN:
-            logger.warn("API密钥错误")
-            return schemas.Response(success=False, message="API密钥错误")
-        # 检查记录
-        historys = self.get_data("history")
-        if not historys:
-            logger.warn("未找到检查记录")
-            return schemas.Response(success=False, message="未找到检查记录")
-
-        is_success, historys = self.__add_subscribe_by_unique(historys, key)
-        if is_success:
-            logger.info(f"添加 {key} 订阅成功")
-            self.save_data("history", historys)
-            return schemas.Response(success=True, message="订阅成功")
-        else:
-            logger.warn(f"添加 {key} 订阅失败")
-            return schemas.Response(success=False, message="订阅失败")
+        return self.bulk_action([key], "add_subscribe_history", apikey)
 
     def set_all_exist_history(self, key: str, apikey: str):
         """
         标记存在检查记录
         """
-        logger.info(f"开始标记存在检查记录: {key}")
-        if apikey != settings.API_TOKEN:
-            logger.warn("API密钥错误")
-            return schemas.Response(success=False, message="API密钥错误")
-        # 检查记录
-        historys = self.get_data("history")
-        if not historys:
-            logger.warn("未找到检查记录")
-            return schemas.Response(success=False, message="未找到检查记录")
-
-        is_success, historys = EpisodeNoExist.__update_exist_status_by_unique(
-            historys, key, HistoryStatus.ALL_EXIST.value
-        )
-        if is_success:
-            logger.info(f"标记存在 {key} 成功")
-            self.save_data("history", historys)
-            return schemas.Response(success=True, message="标记存在成功")
-        else:
-            logger.warn(f"标记存在 {key} 失败")
-            return schemas.Response(success=False, message="标记存在失败")
+        return self.bulk_action([key], "set_all_exist_history", apikey)
 
     def get_form(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        return [
-            {
-                "component": "VForm",
-                "content": [
-                    {
-                        "component": "VRow",
-                        "content": [
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "enabled",
-                                            "label": "启用插件",
-                                        },
-                                    }
-                                ],
-                            },
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "only_season_exist",
-                                            "label": "仅检查已有季缺失",
-                                        },
-                                    }
-                                ],
-                            },
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "clear",
-                                            "label": "清理检查记录",
-                                        },
-                                    }
-                                ],
-                            },
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "onlyonce",
-                                            "label": "立即运行一次",
-                                        },
-                                    }
-                                ],
-                            },
-                        ],
-                    },
-                    {
-                        "component": "VRow",
-                        "content": [
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VTextField",
-                                        "props": {
-                                            "model": "cron",
-                                            "label": "执行周期",
-                                            "placeholder": "5位cron表达式, 留空自动",
-                                        },
-                                    }
-                                ],
-                            },
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSelect",
-                                        "props": {
-                                            "model": "history_type",
-                                            "label": "历史数据类型",
-                                            "items": [
-                                                {
-                                                    "title": f"{HistoryDataType.LATEST.value}",
-                                                    "value": f"{HistoryDataType.LATEST.value}",
-                                                },
-                                                {
-                                                    "title": f"{HistoryDataType.NO_EXIST.value}",
-                                                    "value": f"{HistoryDataType.NO_EXIST.value}",
-                                                },
-                                                {
-                                                    "title": f"{HistoryDataType.NOT_ALL_NO_EXIST.value}",
-                                                    "value": f"{HistoryDataType.NOT_ALL_NO_EXIST.value}",
-                                                },
-                                                {
-                                                    "title": f"{HistoryDataType.ALL_EXIST.value}",
-                                                    "value": f"{HistoryDataType.ALL_EXIST.value}",
-                                                },
-                                                {
-                                                    "title": f"{HistoryDataType.ADDED_RSS.value}",
-                                                    "value": f"{HistoryDataType.ADDED_RSS.value}",
-                                                },
-                                                {
-                                                    "title": f"{HistoryDataType.FAILED.value}",
-                                                    "value": f"{HistoryDataType.FAILED.value}",
-                                                },
-                                                {
-                                                    "title": f"{HistoryDataType.ALL.value}",
-                                                    "value": f"{HistoryDataType.ALL.value}",
-                                                },
-                                            ],
-                                        },
-                                    }
-                                ],
-                            },
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSelect",
-                                        "props": {
-                                            "model": "no_exist_action",
-                                            "label": "缺失处理方式",
-                                            "items": [
-                                                {
-                                                    "title": f"{NoExistAction.ONLY_HISTORY.value}",
-                                                    "value": f"{NoExistAction.ONLY_HISTORY.value}",
-                                                },
-                                                {
-                                                    "title": f"{NoExistAction.ADD_SUBSCRIBE.value}",
-                                                    "value": f"{NoExistAction.ADD_SUBSCRIBE.value}",
-                                                },
-                                                {
-                                                    "title": f"{NoExistAction.SET_ALL_EXIST.value}",
-                                                    "value": f"{NoExistAction.SET_ALL_EXIST.value}",
-                                                },
-                                            ],
-                                        },
-                                    }
-                                ],
-                            },
-                        ],
-                    },
-                    {
-                        "component": "VRow",
-                        "content": [
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 12},
-                                "content": [
-                                    {
-                                        "component": "VTextField",
-                                        "props": {
-                                            "model": "whitelist_librarys",
-                                            "label": "电视剧媒体库白名单",
-                                            "placeholder": "*必填, 多个名称用英文逗号分隔",
-                                        },
-                                    }
-                                ],
-                            },
-                        ],
-                    },
-                    {
-                        "component": "VRow",
-                        "content": [
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 12},
-                                "content": [
-                                    {
-                                        "component": "VTextField",
-                                        "props": {
-                                            "model": "whitelist_media_servers",
-                                            "label": "媒体服务器名称白名单",
-                                            "placeholder": "留空默认全部, 多个名称用英文逗号分隔: emby,embyA,embyB,jellyfin,plex",
-                                        },
-                                    }
-                                ],
-                            },
-                        ],
-                    },
-                    {
-                        "component": "VRow",
-                        "content": [
-                            {
-                                "component": "VCol",
-                                "content": [
-                                    {
-                                        "component": "VTextarea",
-                                        "props": {
-                                            "model": "save_path_replaces",
-                                            "label": "下载路径替换, 一行一个",
-                                            "placeholder": "将媒体库电视剧的路径替换为下载路径, 用英文冒号作为分割。不输入则按默认下载路径处理。\n例如将'/media/library/tv/上载新生 (2020)'的下载路径设置为'/downloads/tv', 则输入 /media/library:/downloads",
-                                        },
-                                    }
-                                ],
-                            }
-                        ],
-                    },
-                ],
-            }
-        ], {
-            "enabled": False,
-            "cron": "",
-            "onlyonce": False,
-            "only_season_exist": True,
-            "clear": False,
-            "history_type": HistoryDataType.LATEST.value,
-            "save_path_replaces": "",
-            "no_exist_action": NoExistAction.ONLY_HISTORY.value,
-            "whitelist_media_servers": "",
-            "whitelist_librarys": "",
-        }
+        return _FORM_SPEC, _FORM_DEFAULTS
 
-    def __get_action_buttons_content(self, unique: str | None, status: str):
+    def __get_action_buttons_content(
+        self, unique: str | None, status: str, api_token: str
+    ):
         if not unique:
             return []
-        action_buttons = {
-            "add_subscribe_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-primary flex-grow",
-                    "variant": "tonal",
-                    "style": "height: 100%",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/EpisodeNoExist/add_subscribe_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "订阅缺失",
-            },
-            "set_all_exist_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-success flex-grow",
-                    "style": "height: 100%",
-                    "variant": "tonal",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/EpisodeNoExist/set_all_exist_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "标记存在",
-            },
-            "delete_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-error flex-grow",
-                    "style": "height: 100%",
-                    "variant": "tonal",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/EpisodeNoExist/delete_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "删除记录",
-            },
-        }
 
-        action_names = {
-            HistoryStatus.NO_EXIST.value: [
-                "delete_history",
-                "set_all_exist_history",
-                "add_subscribe_history",
-            ],
-            HistoryStatus.ADDED_RSS.value: [
-                "delete_history",
-                "set_all_exist_history",
-            ],
-        }.get(status, ["delete_history"])
+        templates = _ACTION_BUTTONS_BY_STATUS.get(status, _DEFAULT_ACTION_BUTTONS)
 
         action_buttons_list = [
-            action_buttons.get(name)
-            for name in action_names
-            if action_buttons.get(name) is not None
+            EpisodeNoExist.__get_action_button_content(template, unique, api_token)
+            for template in templates
         ]
 
         return action_buttons_list
 
-    def __get_history_post_content(self, history: ExtendedHistoryDetail):
+    @staticmethod
+    def __get_action_button_content(
+        template: Dict[str, Any], unique: str, api_token: str
+    ) -> dict[str, Any]:
+        """
+        基于按钮模板生成操作按钮, 仅重建包含检查记录key的请求参数
+        """
+        click = template["events"]["click"]
+        return {
+            **template,
+            "events": {
+                "click": {
+                    **click,
+                    "params": {
+                        "key": unique,
+                        "apikey": api_token,
+                    },
+                }
+            },
+        }
+
+    def __get_history_post_content(
+        self, history: ExtendedHistoryDetail, api_token: str, mp_domain: str
+    ):
         def __count_seasons_episodes(
             seasons_episodes_info: Dict[str, EpisodeNoExistInfo],
         ):
             seasons_episodes_info = seasons_episodes_info or {}
-            seasons_count = len(seasons_episodes_info.keys())
-            episodes_count = 0
-            for season in seasons_episodes_info.values():
-                if season["episode_no_exist"]:
-                    episodes_count += len(season["episode_no_exist"])
-                else:
-                    episodes_count += season["episode_total"]
+            seasons_count = len(seasons_episodes_info)
+            # 有缺失集时按缺失集计数, 否则整季缺失按总集数计数
+            episodes_count = sum(
+                (
+                    len(season["episode_no_exist"])
+                    if season.get("episode_no_exist")
+                    else season.get("episode_total", 0)
+                )
+                for season in seasons_episodes_info.values()
+            )
             return seasons_count, episodes_count
 
         history = history or {}
+        unique = history.get("unique")
+
+        # 检查记录未变化时复用已生成的卡片
+        cache_key = (
+            history.get("last_update_full"),
+            history.get("exist_status"),
+            api_token,
+            mp_domain,
+        )
+        cached_post = self._post_cache.get(unique) if unique else None
+        if cached_post and cached_post[0] == cache_key:
+            return cached_post[1]
+
         time_str = history.get("last_update")
 
         tv_no_exist_info: TvNoExistInfo = history.get("tv_no_exist_info") or {}  # type: ignore
 
-        title = tv_no_exist_info.get("title", "未知")
-        title = title[:8] + "..." if len(title) > 8 else title
+        # 旧记录没有保存展示标题, 按标题生成
+        title = tv_no_exist_info.get("display_title") or get_display_title(
+            tv_no_exist_info.get("title")
+        )
 
         year = tv_no_exist_info.get("year", "未知")
         tmdbid = tv_no_exist_info.get("tmdbid", 0)
@@ -1393,7 +1678,6 @@ class EpisodeNoExist(_PluginBase):
         if status == HistoryStatus.NO_EXIST.value:
             status = f"缺失{season_no_exist_count}季, {episode_no_exist_count}集"
 
-        mp_domain = settings.MP_DOMAIN()
         link = f"#/media?mediaid=tmdb:{tmdbid}&type={MediaType.TV.value}"
         if mp_domain:
             if mp_domain.endswith("/"):
@@ -1401,8 +1685,6 @@ class EpisodeNoExist(_PluginBase):
             else:
                 link = f"{mp_domain}/{link}"
 
-        unique = history.get("unique")
-
         if tmdbid and tmdbid != 0:
             href = f"{link}"
         else:
@@ -1411,6 +1693,7 @@ class EpisodeNoExist(_PluginBase):
         action_buttons_content = self.__get_action_buttons_content(
             unique,
             _status,
+            api_token,
         )
 
         component = {
@@ -1434,7 +1717,7 @@ class EpisodeNoExist(_PluginBase):
                                 "class": "object-cover shadow ring-gray-500 max-w-32",
                                 "cover": True,
                                 "transition": True,
-                                "lazy-src": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAPAAAACgCAQAAACY0inuAAABB0lEQVR42u3RMREAAAjEMF45M65xwcClEppMlx4XwIAFWIAFWIAFWIABC7AAC7AAC7AAAxZgARZgARZgARZgwAIswAIswAIswIAFWIAFWIAFWIABC7AAC7AAC7AACzBgARZgARZgARZgwAIswAIswAIswIABAxZgARZgARZgAQYswAIswAIswAIMWIAFWIAFWIAFWIABC7AAC7AAC7AAAxZgARZgARZgAQYswAIswAIswAIswIAFWIAFWIAFWIABC7AAC7AAC7AAAzYBsAALsAALsAALMGABFmABFmABFmDAAizAAizAAizAAgxYgAVYgAVYgAUYsAALsAALsAALMGABFmAB1m0LDz+locM0WkgAAAAASUVORK5CYII=",
+                                "lazy-src": _LAZY_SRC_PLACEHOLDER,
                             },
                         },
                         {
@@ -1509,12 +1792,17 @@ class EpisodeNoExist(_PluginBase):
             ],
         }
 
+        if unique:
+            self._post_cache[unique] = (cache_key, component)
+
         return component
 
     def __get_historys_posts_content(
         self, historys: List[ExtendedHistoryDetail] | None
     ):
-
+        """
+        生成检查记录卡片, 未变化的卡片由 _post_cache 复用
+        """
         posts_content = []
         if not historys:
             posts_content = [
@@ -1527,8 +1815,13 @@ class EpisodeNoExist(_PluginBase):
                 }
             ]
         else:
+            # 每次渲染只读取一次配置
+            api_token = settings.API_TOKEN
+            mp_domain = settings.MP_DOMAIN()
             for history in historys:
-                posts_content.append(self.__get_history_post_content(history))
+                posts_content.append(
+                    self.__get_history_post_content(history, api_token, mp_domain)
+                )
 
         component = {
             "component": "div",
@@ -1558,7 +1851,7 @@ class EpisodeNoExist(_PluginBase):
         return component
 
     @staticmethod
-    def __get_svg_content(color: str, ds: List[str]):
+    def __get_svg_content(color: str, ds: Sequence[str]):
         def __get_path_content(fill: str, d: str) -> dict[str, Any]:
             return {
                 "component": "path",
@@ -1579,89 +1872,48 @@ class EpisodeNoExist(_PluginBase):
         return component
 
     @staticmethod
-    def __get_icon_content():
+    def __get_icon_content() -> Dict[Icons, Dict[str, Any]]:
+        # 图标内容固定, 首次生成后缓存
+        if EpisodeNoExist._icon_content is not None:
+            return EpisodeNoExist._icon_content
+
         color = "#8a8a8a"
         icon_content = {
-            Icons.TARGET: EpisodeNoExist.__get_svg_content(
-                color,
-                [
-                    "M512 307.2c-114.688 0-204.8 90.112-204.8 204.8 0 110.592 90.112 204.8 204.8 204.8s204.8-90.112 204.8-204.8-90.112-204.8-204.8-204.8z",
-                    "M962.56 471.04H942.08c-20.48-204.8-184.32-372.736-389.12-389.12v-20.48c0-24.576-16.384-40.96-40.96-40.96s-40.96 16.384-40.96 40.96v16.384c-204.8 20.48-372.736 184.32-389.12 393.216h-20.48c-24.576 0-40.96 16.384-40.96 40.96s16.384 40.96 40.96 40.96h16.384c20.48 204.8 184.32 372.736 393.216 393.216v16.384c0 24.576 16.384 40.96 40.96 40.96s40.96-16.384 40.96-40.96V942.08c204.8-20.48 372.736-184.32 393.216-389.12h16.384c24.576 0 40.96-16.384 40.96-40.96s-16.384-40.96-40.96-40.96z m-409.6 389.12v-24.576c0-24.576-16.384-40.96-40.96-40.96s-40.96 16.384-40.96 40.96v24.576c-159.744-20.48-290.816-147.456-307.2-307.2h24.576c24.576 0 40.96-16.384 40.96-40.96s-16.384-40.96-40.96-40.96H163.84c16.384-159.744 147.456-290.816 307.2-307.2v24.576c0 24.576 16.384 40.96 40.96 40.96s40.96-16.384 40.96-40.96V163.84c159.744 20.48 290.816 147.456 307.2 307.2h-24.576c-24.576 0-40.96 16.384-40.96 40.96s16.384 40.96 40.96 40.96h24.576c-16.384 159.744-147.456 290.816-307.2 307.2z",
-                ],
-            ),
-            Icons.ADD_SCHEDULE: EpisodeNoExist.__get_svg_content(
-                color,
-                [
-                    "M611.157333 583.509333h-63.146666v-63.146666c0-20.138667-16.042667-36.181333-35.84-36.181334-20.138667 0-35.84 16.042667-35.84 35.84v63.146667h-63.146667c-19.797333 0-36.181333 16.384-36.181333 36.181333 0.7168 21.128533 16.759467 35.498667 36.181333 36.181334h63.146667v62.805333c0 20.923733 16.759467 35.84 35.84 35.84 19.797333 0 35.84-16.042667 35.84-35.84v-63.146667h63.146666a35.84 35.84 0 1 0 0-71.68z",
-                    "M839.338667 145.749333h-13.653334v86.016c0 56.32-45.738667 102.4-102.4 102.4-56.32 0-102.4-46.08-102.4-102.4V145.749333h-217.770666v86.016c0 56.32-46.08 102.4-102.4 102.4-56.661333 0-102.4-46.08-102.4-102.4V145.749333h-13.653334C120.490667 145.749333 68.266667 197.973333 68.266667 262.144v551.594667c0 64.170667 52.224 116.394667 116.394666 116.394666h654.677334c64.170667 0 116.394667-52.224 116.394666-116.394666V262.144c0-64.170667-52.224-116.394667-116.394666-116.394667z m0 716.117334H184.661333c-26.624 0-48.128-21.504-48.128-48.128V402.773333h750.933334v410.965334c0 26.624-21.504 48.128-48.128 48.128z",
-                    "M300.612267 265.796267a34.133333 34.133333 0 0 0 34.133333-34.133334V128a34.133333 34.133333 0 1 0-68.266667 0v103.6288a34.133333 34.133333 0 0 0 34.133334 34.133333zM723.3536 265.796267a34.133333 34.133333 0 0 0 34.133333-34.133334V128a34.133333 34.133333 0 1 0-68.266666 0v103.6288a34.133333 34.133333 0 0 0 34.133333 34.133333z",
-                ],
-            ),
-            Icons.BUG_REMOVE: EpisodeNoExist.__get_svg_content(
-                color,
-                [
-                    "M945.000296 566.802963c-25.486222-68.608-91.211852-79.530667-144.19437-72.855704a464.402963 464.402963 0 0 0-29.316741-101.148444c20.366222-8.343704 48.279704-12.136296 70.731852 14.487704a37.925926 37.925926 0 0 0 57.912889-49.000297c-51.655111-61.060741-117.94963-53.589333-164.636445-32.426666a333.482667 333.482667 0 0 0-72.021333-78.696297c2.654815-11.377778 4.399407-23.021037 4.399408-35.157333 0-19.683556-4.020148-38.305185-10.695112-55.675259 10.467556-10.960593 30.644148-25.979259 61.705482-23.058963a37.660444 37.660444 0 0 0 41.339259-34.17126 37.925926 37.925926 0 0 0-34.133333-41.339259 145.294222 145.294222 0 0 0-113.246815 36.560593A153.182815 153.182815 0 0 0 513.137778 56.888889c-36.408889 0-69.404444 13.160296-95.876741 34.285037a145.59763 145.59763 0 0 0-109.37837-33.450667 37.925926 37.925926 0 1 0 7.205926 75.548445 73.007407 73.007407 0 0 1 55.902814 17.597629A154.737778 154.737778 0 0 0 358.4 212.005926c0 12.212148 1.782519 23.969185 4.475259 35.384889A334.051556 334.051556 0 0 0 290.512593 326.807704c-46.800593-21.845333-114.194963-30.492444-166.646519 31.478518a37.925926 37.925926 0 0 0 57.912889 49.000297c23.134815-27.382519 52.261926-22.641778 72.969481-13.615408a464.213333 464.213333 0 0 0-28.975407 100.655408c-53.475556-7.395556-120.832 2.768593-146.773333 72.438518a37.925926 37.925926 0 1 0 71.111111 26.43437c10.24-27.534222 44.259556-27.230815 68.532148-23.134814-0.644741 33.374815 1.137778 64.891259 9.253926 106.192592-38.456889 10.884741-81.768296 39.405037-101.793185 103.461926a37.925926 37.925926 0 0 0 72.438518 22.603852c11.150222-35.65037 32.768-48.810667 49.682963-53.551407 47.900444 129.024 148.555852 218.339556 265.102222 218.339555 116.280889 0 216.746667-88.936296 264.798815-217.467259 16.535704 5.271704 36.712296 18.659556 47.369482 52.679111a37.888 37.888 0 1 0 72.400592-22.603852c-19.569778-62.691556-61.44-91.401481-99.252148-102.779259 8.305778-42.059852 10.012444-73.500444 9.367704-107.254519 24.007111-3.678815 55.978667-3.109926 65.877333 23.514074a37.925926 37.925926 0 1 0 71.111111-26.396444z m-321.308444 69.973333c14.791111 14.791111 14.791111 39.063704 0 53.854815a38.039704 38.039704 0 0 1-53.475556 0l-56.888889-56.888889-56.888888 56.888889a38.456889 38.456889 0 0 1-53.854815 0c-14.791111-14.791111-14.791111-39.063704 0-53.854815l56.888889-56.888889-56.888889-56.888888a37.774222 37.774222 0 0 1 0-53.475556c14.791111-14.791111 39.063704-14.791111 53.854815 0l56.888888 56.888889 56.888889-56.888889a37.774222 37.774222 0 0 1 53.475556 0c14.791111 14.791111 14.791111 38.684444 0 53.475556l-56.888889 56.888888 56.888889 56.888889z"
-                ],
-            ),
-            Icons.WARNING: EpisodeNoExist.__get_svg_content(
-                color,
-                [
-                    "M965.316923 727.276308l-319.015385-578.953846c-58.171077-106.299077-210.944-106.023385-268.996923 0l-318.621538 579.347692c-56.359385 102.636308 18.116923 227.643077 134.695385 227.643077h637.243076c116.184615 0 191.172923-124.416 134.695385-228.036923z m-453.316923 26.781538c-24.812308 0-44.504615-20.086154-44.504615-44.504615 0-24.812308 19.692308-44.898462 44.504615-44.898462a44.701538 44.701538 0 0 1 0 89.403077z m57.501538-361.156923l-20.873846 170.929231c-1.575385 19.298462-17.329231 33.870769-36.627692 33.870769s-35.446154-14.572308-37.021538-33.870769l-20.48-170.929231c-3.150769-33.870769 23.630769-63.015385 57.501538-63.015385 29.932308 0 57.501538 21.582769 57.501538 63.015385z"
-                ],
-            ),
-            Icons.GLASSES: EpisodeNoExist.__get_svg_content(
-                color,
-                [
-                    "M1028.096 503.808L815.104 204.8c-8.192-12.288-20.48-16.384-32.768-16.384h-126.976c-24.576 0-40.96 20.48-40.96 40.96 0 24.576 20.48 40.96 40.96 40.96h102.4l131.072 184.32H143.36l135.168-188.416h102.4c24.576 0 40.96-16.384 40.96-40.96s-16.384-40.96-40.96-40.96H253.952c-16.384 0-24.576 8.192-32.768 16.384L8.192 499.712c0 8.192-8.192 32.768-8.192 53.248v188.416c0 53.248 45.056 94.208 98.304 94.208h266.24c53.248 0 94.208-40.96 94.208-94.208v-188.416-12.288h122.88V741.376c0 53.248 40.96 94.208 98.304 94.208h266.24c53.248 0 94.208-40.96 94.208-94.208v-188.416c0-16.384-8.192-40.96-12.288-49.152zM376.832 716.8c0 20.48-16.384 40.96-40.96 40.96H122.88c-20.48 0-40.96-20.48-40.96-40.96v-135.168c0-24.576 20.48-40.96 40.96-40.96H335.872c24.576 0 40.96 16.384 40.96 40.96v135.168z m581.632 0c0 20.48-16.384 40.96-40.96 40.96H704.512c-20.48 0-40.96-20.48-40.96-40.96v-135.168c0-24.576 20.48-40.96 40.96-40.96h212.992c24.576 0 40.96 16.384 40.96 40.96v135.168z",
-                ],
-            ),
-            Icons.STATISTICS: EpisodeNoExist.__get_svg_content(
-                color,
-                [
-                    "M471.04 270.336V20.48c-249.856 20.48-450.56 233.472-450.56 491.52 0 274.432 225.28 491.52 491.52 491.52 118.784 0 229.376-40.96 315.392-114.688L655.36 708.608c-40.96 28.672-94.208 45.056-139.264 45.056-135.168 0-245.76-106.496-245.76-245.76 0-114.688 81.92-217.088 200.704-237.568z",
-                    "M552.96 20.48v249.856C655.36 286.72 737.28 368.64 753.664 471.04h249.856C983.04 233.472 790.528 40.96 552.96 20.48zM712.704 651.264l176.128 176.128c65.536-77.824 106.496-172.032 114.688-274.432h-249.856c-8.192 36.864-20.48 69.632-40.96 98.304z",
-                ],
-            ),
+            icon: EpisodeNoExist.__get_svg_content(color, paths)
+            for icon, paths in EpisodeNoExist._ICON_PATHS.items()
         }
+        EpisodeNoExist._icon_content = icon_content
         return icon_content
 
     @staticmethod
     def __get_historys_statistic_content(
-        title: str, value: str, icon_name: Icons
+        title: str, value: str, icon_content: Dict[str, Any] | str
     ) -> dict[str, Any]:
-        icon_content = EpisodeNoExist.__get_icon_content().get(icon_name, "")
         total_elements = {
             "component": "VCard",
-            "props": {
-                "variant": "tonal",
-                "style": "width: 10rem;",
-            },
+            "props": _STAT_CARD_PROPS["card"],
             "content": [
                 {
                     "component": "VCardText",
-                    "props": {
-                        "class": "d-flex align-center",
-                    },
+                    "props": _STAT_CARD_PROPS["card_text"],
                     "content": [
                         icon_content,
                         {
                             "component": "div",
-                            "props": {
-                                "class": "ml-2",
-                            },
+                            "props": _STAT_CARD_PROPS["body"],
                             "content": [
                                 {
                                     "component": "span",
-                                    "props": {"class": "text-caption"},
+                                    "props": _STAT_CARD_PROPS["title"],
                                     "text": f"{title}",
                                 },
                                 {
                                     "component": "div",
-                                    "props": {"class": "d-flex align-center flex-wrap"},
+                                    "props": _STAT_CARD_PROPS["value_row"],
                                     "content": [
                                         {
                                             "component": "span",
-                                            "props": {"class": "text-h6"},
+                                            "props": _STAT_CARD_PROPS["value"],
                                             "text": f"{value}",
                                         }
                                     ],
@@ -1684,50 +1936,27 @@ class EpisodeNoExist(_PluginBase):
         history_not_all_no_exist_total,
     ):
 
-        # 数据统计
-        data_statistics = [
-            {
-                "title": "总处理",
-                "value": f"{historys_total}部",
-                "icon_name": Icons.STATISTICS,
-            },
-            {
-                "title": "存在缺失",
-                "value": f"{historys_no_exist_total}部",
-                "icon_name": Icons.WARNING,
-            },
-            {
-                "title": "已有季缺失",
-                "value": f"{history_not_all_no_exist_total}部",
-                "icon_name": Icons.TARGET,
-            },
-            {
-                "title": "未识别",
-                "value": f"{historys_fail_total}部",
-                "icon_name": Icons.BUG_REMOVE,
-            },
-            {
-                "title": "全部存在",
-                "value": f"{historys_all_exist_total}部",
-                "icon_name": Icons.GLASSES,
-            },
-            {
-                "title": "已订阅",
-                "value": f"{historys_added_rss_total}部",
-                "icon_name": Icons.ADD_SCHEDULE,
-            },
-        ]
+        # 数据统计: (标题, 数量, 图标)
+        data_statistics = (
+            ("总处理", historys_total, Icons.STATISTICS),
+            ("存在缺失", historys_no_exist_total, Icons.WARNING),
+            ("已有季缺失", history_not_all_no_exist_total, Icons.TARGET),
+            ("未识别", historys_fail_total, Icons.BUG_REMOVE),
+            ("全部存在", historys_all_exist_total, Icons.GLASSES),
+            ("已订阅", historys_added_rss_total, Icons.ADD_SCHEDULE),
+        )
 
-        content = list(
-            map(
-                lambda s: EpisodeNoExist.__get_historys_statistic_content(
-                    title=str(s["title"]),
-                    value=str(s["value"]),
-                    icon_name=Icons(s["icon_name"]),
-                ),
-                data_statistics,
+        # 所有统计卡片共用一次图标查找, 数量为0的统计不显示
+        icons_content = EpisodeNoExist.__get_icon_content()
+        content = [
+            EpisodeNoExist.__get_historys_statistic_content(
+                title=title,
+                value=f"{total}部",
+                icon_content=icons_content.get(icon_name, ""),
             )
-        )
+            for title, total, icon_name in data_statistics
+            if total
+        ]
 
         component = {
             "component": "VRow",
@@ -1736,6 +1965,20 @@ class EpisodeNoExist(_PluginBase):
         }
         return component
 
+    @staticmethod
+    def __has_partial_miss(history: ExtendedHistoryDetail) -> bool:
+        """
+        是否有季存在缺失集数 (已有季缺失)
+        """
+        tv_no_exist_info = history.get("tv_no_exist_info") or {}
+        season_episode_no_exist_info = (
+            tv_no_exist_info.get("season_episode_no_exist_info") or {}
+        )
+        return any(
+            season_info["episode_no_exist"]
+            for season_info in season_episode_no_exist_info.values()
+        )
+
     def get_page(self) -> List[Dict[str, Any]]:
         """
         拼装插件详情页面, 需要返回页面配置, 同时附带数据
@@ -1755,41 +1998,35 @@ class EpisodeNoExist(_PluginBase):
                 }
             ]
 
-        details = historys.get("details", {})
+        # 检查记录和历史数据类型都未变化时直接返回上次生成的页面
+        version = historys.get("version")
+        page_key = (version, self._history_type)
+        cached_page = self._page_cache.get(page_key)
+        if cached_page is not None:
+            self._page_cache.move_to_end(page_key)
+            return cached_page
 
-        def sort_history(history_list):
-            history_list.sort(key=lambda x: x["last_update_full"], reverse=True)
+        details = historys.get("details", {})
 
-        history_failed: List[ExtendedHistoryDetail] = []
-        history_all_exist: List[ExtendedHistoryDetail] = []
-        history_added_rss: List[ExtendedHistoryDetail] = []
-        history_no_exist: List[ExtendedHistoryDetail] = []
+        # get_data 每次返回新读取的数据, 直接补充 unique 字段, 无需复制
         history_all: List[ExtendedHistoryDetail] = []
-
-        # 字典将exist_status映射到相应的列表
-        status_to_list = {
-            HistoryStatus.FAILED.value: history_failed,
-            HistoryStatus.ADDED_RSS.value: history_added_rss,
-            HistoryStatus.ALL_EXIST.value: history_all_exist,
-            HistoryStatus.NO_EXIST.value: history_no_exist,
-        }
-
         for key, item in details.items():
-            item_with_key = item.copy()
-            item_with_key["unique"] = key
-            history_all.append(item_with_key)
-
-            # 根据exist_status分类项目
-            target_list = status_to_list.get(item["exist_status"])
-            if target_list is not None:
-                target_list.append(item_with_key)
-
-        # 对所有列表排序
-        sort_history(history_all)
-        sort_history(history_failed)
-        sort_history(history_all_exist)
-        sort_history(history_added_rss)
-        sort_history(history_no_exist)
+            item["unique"] = key
+            history_all.append(item)
+
+        # 只排序一次, 再按顺序一次分组到各状态列表, 保持同样的顺序
+        # 仅显示最新记录时分组只用于统计数量, 不需要完整排序
+        sort_key = operator.itemgetter("last_update_full")
+        show_latest = self._history_type == HistoryDataType.LATEST.value
+        if not show_latest:
+            history_all.sort(key=sort_key, reverse=True)
+        buckets: DefaultDict[str, List[ExtendedHistoryDetail]] = defaultdict(list)
+        for item in history_all:
+            buckets[item["exist_status"]].append(item)
+        history_failed = buckets[HistoryStatus.FAILED.value]
+        history_all_exist = buckets[HistoryStatus.ALL_EXIST.value]
+        history_added_rss = buckets[HistoryStatus.ADDED_RSS.value]
+        history_no_exist = buckets[HistoryStatus.NO_EXIST.value]
 
         # 根据_history_type确定使用的列表
         history_type_to_list = {
@@ -1800,30 +2037,21 @@ class EpisodeNoExist(_PluginBase):
             HistoryDataType.ALL.value: history_all,
         }
 
-        def __get_season_episode_no_exist_info(
-            _history: ExtendedHistoryDetail,
-        ):
-            _tv_no_exist_info = _history.get("tv_no_exist_info")
-            if not _tv_no_exist_info:
-                return []
-            _no_exist_info = _tv_no_exist_info.get("season_episode_no_exist_info")
-            if not _no_exist_info:
-                return []
-
-            _values = _no_exist_info.values()
-            return _values
-
-        history_not_all_no_exist = [
-            history
+        # 统计只需要数量, 列表仅在选中该类型时生成
+        history_not_all_no_exist_total = sum(
+            1
             for history in history_no_exist
-            if any(
-                season_info["episode_no_exist"]
-                for season_info in __get_season_episode_no_exist_info(history)
-            )
-        ]
+            if EpisodeNoExist.__has_partial_miss(history)
+        )
 
         if self._history_type == HistoryDataType.NOT_ALL_NO_EXIST.value:
-            historys_in_type = history_not_all_no_exist
+            historys_in_type = [
+                history
+                for history in history_no_exist
+                if EpisodeNoExist.__has_partial_miss(history)
+            ]
+        elif show_latest:
+            historys_in_type = heapq.nlargest(6, history_all, key=sort_key)
         else:
             historys_in_type = history_type_to_list.get(
                 self._history_type, history_all[:6]
@@ -1838,8 +2066,6 @@ class EpisodeNoExist(_PluginBase):
         historys_fail_total = len(history_failed)
         historys_added_rss_total = len(history_added_rss)
         historys_all_exist_total = len(history_all_exist)
-        historys_all_exist_total = len(history_all_exist)
-        history_not_all_no_exist_total = len(history_not_all_no_exist)
         historys_statistics_content = self.__get_historys_statistics_content(
             historys_total=historys_total,
             historys_no_exist_total=historys_no_exist_total,
@@ -1850,7 +2076,7 @@ class EpisodeNoExist(_PluginBase):
         )
 
         # 拼装页面
-        return [
+        page = [
             {
                 "component": "div",
                 "content": [
@@ -1859,3 +2085,7 @@ class EpisodeNoExist(_PluginBase):
                 ],
             },
         ]
+        self._page_cache[page_key] = page
+        if len(self._page_cache) > self._page_cache_size:
+            self._page_cache.popitem(last=False)
+        return page